@@ -1,4 +1,12 @@
 from .cli import MimicCLI
-from .mimic import MIMIC
 
 __all__ = ["MIMIC", "MimicCLI"]
+
+
+def __getattr__(name: str):
+    # Resolve MIMIC on first access so CLI-only imports skip polars/bs4/pandas
+    if name == "MIMIC":
+        from .mimic import MIMIC
+
+        return MIMIC
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,7 +3,7 @@ import sqlite3
 
 import pandas as pd
 from beartype import beartype
-from beartype.typing import Any, Dict
+from beartype.typing import Any, Dict, Iterator
 from MCPStack.core.utils.exceptions import (
     MCPStackInitializationError as M3InitializationError,
 )
@@ -13,6 +13,8 @@ from ..base import BackendBase
 
 logger = logging.getLogger(__name__)
 
+RESULT_CHUNK_SIZE = 10_000
+
 
 @beartype
 class SQLiteBackend(BackendBase):
@@ -43,19 +45,26 @@ class SQLiteBackend(BackendBase):
         if not self.connection:
             raise M3ValidationError("SQLite backend not initialized")
         try:
-            dataframe = pd.read_sql_query(operation, self.connection)
-            return self._format_result(dataframe)
+            chunks = pd.read_sql_query(
+                operation, self.connection, chunksize=RESULT_CHUNK_SIZE
+            )
+            return self._format_result(chunks)
         except sqlite3.Error as e:
             raise M3ValidationError(f"SQLite execution failed: {e}") from e
 
-    def _format_result(self, dataframe: pd.DataFrame) -> str:
-        if dataframe.empty:
+    def _format_result(self, chunks: Iterator[pd.DataFrame]) -> str:
+        # Only the first 50 rows are shown, so count the rest without keeping them
+        head = None
+        total_rows = 0
+        for chunk in chunks:
+            if head is None:
+                head = chunk.head(50)
+            total_rows += len(chunk)
+        if head is None or total_rows == 0:
             return "No results found"
-        if len(dataframe) > 50:
-            result = dataframe.head(50).to_string(index=False)
-            result += f"\n... ({len(dataframe)} total rows, showing first 50)"
-        else:
-            result = dataframe.to_string(index=False)
+        result = head.to_string(index=False)
+        if total_rows > 50:
+            result += f"\n... ({total_rows} total rows, showing first 50)"
         return result
 
     def teardown(self) -> None:
@@ -10,16 +10,23 @@ from MCPStack.core.config import StackConfig as M3Config
 from MCPStack.core.tool.cli.base import BaseToolCLI, ToolConfig
 from MCPStack.core.utils.exceptions import MCPStackValidationError as M3ValidationError
 from rich.console import Console
-from rich.panel import Panel
 from rich.table import Table
 
-from .components.data_io import DataIO
 from .components.utils import get_default_database_path, load_supported_datasets
 
 logger = logging.getLogger(__name__)
 console = Console()
 
 
+@beartype
+def _print_status(message: str, style: str) -> None:
+    # Rich markup/layout only pays off on a terminal; piped output stays plain
+    if console.is_terminal:
+        console.print(f"[{style}]{message}[/{style}]")
+    else:
+        typer.echo(message)
+
+
 @beartype
 class MimicCLI(BaseToolCLI):
     @classmethod
@@ -63,7 +70,7 @@ class MimicCLI(BaseToolCLI):
     ) -> None:
         datasets = load_supported_datasets()
         if dataset.lower() not in datasets:
-            console.print("[red]❌ Unknown dataset. Available:[/red]")
+            _print_status("❌ Unknown dataset. Available:", "red")
             table = Table(show_header=False)
             for ds in datasets.keys():
                 table.add_row(f"[cyan]{ds}[/cyan]")
@@ -75,22 +82,24 @@ class MimicCLI(BaseToolCLI):
             Path(db_path) if db_path else get_default_database_path(config, dataset)
         )
         if _db_path is None:
-            console.print("[red]❌ Cannot determine DB path.[/red]")
+            _print_status("❌ Cannot determine DB path.", "red")
             raise typer.Exit(code=1)
 
         if _db_path.exists() and not force:
-            console.print(
-                f"[yellow]⚠️ DB exists at {_db_path}. Use --force to overwrite.[/yellow]"
+            _print_status(
+                f"⚠️ DB exists at {_db_path}. Use --force to overwrite.", "yellow"
             )
             raise typer.Exit(code=1)
 
+        from .components.data_io import DataIO  # lazy import (polars, bs4)
+
         data_io = DataIO(config)
         success = data_io.initialize(dataset, _db_path)
 
         if success:
-            console.print(f"[green]✅ Initialized {dataset} at {_db_path}.[/green]")
+            _print_status(f"✅ Initialized {dataset} at {_db_path}.", "green")
         else:
-            console.print(f"[red]❌ Initialization failed for {dataset}.[/red]")
+            _print_status(f"❌ Initialization failed for {dataset}.", "red")
             raise typer.Exit(code=1)
 
     @classmethod
@@ -146,7 +155,7 @@ class MimicCLI(BaseToolCLI):
         env_vars: Dict[str, str] = {}
         tool_params: Dict[str, Any] = {}
 
-        console.print("[turquoise4]💬 Configuring MIMIC-IV tool...[/turquoise4]")
+        _print_status("💬 Configuring MIMIC-IV tool...", "turquoise4")
 
         if not backend:
             backend = typer.prompt(
@@ -154,7 +163,7 @@ class MimicCLI(BaseToolCLI):
             ).lower()
 
         if backend not in ["sqlite", "bigquery"]:
-            console.print("[red]❌ Invalid backend. Use 'sqlite' or 'bigquery'.[/red]")
+            _print_status("❌ Invalid backend. Use 'sqlite' or 'bigquery'.", "red")
             raise typer.Exit(code=1)
 
         env_vars["M3_BACKEND"] = backend
@@ -162,19 +171,24 @@ class MimicCLI(BaseToolCLI):
 
         backends_list = []
         if backend == "sqlite":
+            default_db = None
             if db_path is None:
                 default_db = get_default_database_path(M3Config(), "mimic-iv-demo")
                 if default_db is None:
                     raise M3ValidationError("Cannot determine default DB path")
-                console.print(f"[yellow]💬 Default DB path: {default_db}[/yellow]")
+                _print_status(f"💬 Default DB path: {default_db}", "yellow")
                 db_path = typer.prompt(
                     "SQLite DB path (Enter for default)", default=str(default_db)
                 )
             if db_path and not Path(db_path).exists():
-                console.print(
-                    f"[yellow]⚠️ DB path {db_path} does not exist. Using default path.[/yellow]"
+                _print_status(
+                    f"⚠️ DB path {db_path} does not exist. Using default path.", "yellow"
+                )
+                # Reuse the default resolved for the prompt rather than building a
+                # second M3Config (project-root detection, logging setup)
+                db_path = str(
+                    default_db or get_default_database_path(M3Config(), "mimic-iv-demo")
                 )
-                db_path = str(get_default_database_path(M3Config(), "mimic-iv-demo"))
             env_vars["M3_DB_PATH"] = db_path
             backends_list.append({"type": "sqlite", "params": {"path": db_path}})
         elif backend == "bigquery":
@@ -214,8 +228,8 @@ class MimicCLI(BaseToolCLI):
                 env_vars["M3_OAUTH2_JWKS_URL"] = jwks_url
             env_vars["M3_OAUTH2_RATE_LIMIT_REQUESTS"] = str(rate_limit_requests)
 
-        console.print(
-            "\n[turquoise4]💬 Additional env vars (key=value, Enter to finish):[/turquoise4]"
+        _print_status(
+            "\n💬 Additional env vars (key=value, Enter to finish):", "turquoise4"
         )
         additional_env = {}
         while True:
@@ -226,7 +240,7 @@ class MimicCLI(BaseToolCLI):
                 key, value = env_var.split("=", 1)
                 additional_env[key.strip()] = value.strip()
             else:
-                console.print("[red]Invalid: Use key=value[/red]")
+                _print_status("Invalid: Use key=value", "red")
         env_vars.update(additional_env)
 
         config_dict = {"env_vars": env_vars, "tool_params": tool_params}
@@ -234,9 +248,13 @@ class MimicCLI(BaseToolCLI):
         output = output or "mimic_config.json"
         with open(output, "w") as f:
             json.dump(config_dict, f, indent=4)
-        console.print(f"[green]✅ Config dict saved to {output}[/green]")
+        _print_status(f"✅ Config dict saved to {output}", "green")
+
+        if verbose and not console.is_terminal:
+            typer.echo(json.dumps(config_dict, indent=2))
+        elif verbose:
+            from rich.panel import Panel  # lazy import
 
-        if verbose:
             console.print(
                 Panel(
                     json.dumps(config_dict, indent=2),
@@ -274,5 +292,5 @@ class MimicCLI(BaseToolCLI):
                         env_table.add_row(key, value)
                 console.print(env_table)
         except Exception as e:
-            console.print(f"[red]❌ Error getting status: {e}[/red]")
+            _print_status(f"❌ Error getting status: {e}", "red")
             logger.error(f"Status failed: {e}")
@@ -1,12 +1,16 @@
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
 import polars as pl
 import requests
 from beartype import beartype
-from beartype.typing import Any, Dict, List
-from bs4 import BeautifulSoup
+from beartype.typing import Any, Dict, List, Optional
+from bs4 import BeautifulSoup, SoupStrainer
 from MCPStack.core.config import StackConfig as M3Config
 from MCPStack.core.utils.exceptions import MCPStackValidationError
 from rich.console import Console
@@ -15,11 +19,15 @@ from rich.progress import Progress
 from mcpstack_mimic.tools.mimic.components.utils import (
     get_dataset_config,
     get_dataset_raw_files_path,
+    iter_files_with_suffix,
 )
 
 logger = logging.getLogger(__name__)
 
 COMMON_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+MAX_DOWNLOAD_WORKERS = 4
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+TABLE_NAME_TRANSLATION = str.maketrans("-.", "__")
 
 console = Console()
 
@@ -72,8 +80,9 @@ class DataIO:
     ) -> bool:
         base_listing_url = dataset_config["file_listing_url"]
         subdirs_to_scan = dataset_config.get("subdirectories_to_scan", [])
-        session = requests.Session()
-        session.headers.update({"User-Agent": COMMON_USER_AGENT})
+        base_listing_url_path_obj = Path(urlparse(base_listing_url).path)
+        base_listing_url_posix = base_listing_url_path_obj.as_posix()
+        session = self._create_session()
         all_files_to_process = []
         for subdir_name in subdirs_to_scan:
             subdir_listing_url = urljoin(base_listing_url, f"{subdir_name}/")
@@ -84,12 +93,9 @@ class DataIO:
                 continue
             for file_url in csv_urls_in_subdir:
                 url_path_obj = Path(urlparse(file_url).path)
-                base_listing_url_path_obj = Path(urlparse(base_listing_url).path)
                 relative_file_path = (
                     url_path_obj.relative_to(base_listing_url_path_obj)
-                    if url_path_obj.as_posix().startswith(
-                        base_listing_url_path_obj.as_posix()
-                    )
+                    if url_path_obj.as_posix().startswith(base_listing_url_posix)
                     else Path(subdir_name) / url_path_obj.name
                 )
                 local_target_path = raw_files_root_dir / relative_file_path
@@ -97,35 +103,97 @@ class DataIO:
         if not all_files_to_process:
             return False
         unique_files_to_process = sorted(set(all_files_to_process), key=lambda x: x[1])
-        downloaded_count = 0
-        for file_url, target_filepath in unique_files_to_process:
-            if not self._download_single_file(file_url, target_filepath, session):
+        # Downloads are independent and network-bound, so overlap them. The first
+        # failure (or Ctrl-C) sets cancel_event: queued files are skipped and
+        # in-flight transfers stop at their next chunk.
+        cancel_event = threading.Event()
+        # requests.Session is not documented as thread-safe, so each worker
+        # thread gets its own session (and connection pool)
+        worker_state = threading.local()
+        worker_sessions: List[requests.Session] = []
+
+        def download(file_url: str, target_filepath: Path) -> bool:
+            if cancel_event.is_set():
                 return False
-            downloaded_count += 1
-        return downloaded_count == len(unique_files_to_process)
+            worker_session = getattr(worker_state, "session", None)
+            if worker_session is None:
+                worker_session = worker_state.session = self._create_session()
+                worker_sessions.append(worker_session)
+            downloaded = self._download_single_file(
+                file_url, target_filepath, worker_session, progress, cancel_event
+            )
+            if not downloaded:
+                cancel_event.set()
+            return downloaded
+
+        with Progress(console=console, transient=True) as progress:
+            executor = ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS)
+            try:
+                futures = [
+                    executor.submit(download, file_url, target_filepath)
+                    for file_url, target_filepath in unique_files_to_process
+                ]
+                for future in as_completed(futures):
+                    if not future.result():
+                        return False
+                return True
+            finally:
+                cancel_event.set()
+                executor.shutdown(wait=True, cancel_futures=True)
+                for worker_session in worker_sessions:
+                    worker_session.close()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update({"User-Agent": COMMON_USER_AGENT})
+        return session
 
     def _download_single_file(
-        self, url: str, target_filepath: Path, session: requests.Session
+        self,
+        url: str,
+        target_filepath: Path,
+        session: requests.Session,
+        progress: Optional[Progress] = None,
+        cancel_event: Optional[threading.Event] = None,
     ) -> bool:
+        # Write next to the target and rename, so an interrupted download never
+        # leaves a truncated .csv.gz behind for the ETL step to pick up
+        partial_filepath = target_filepath.with_name(f"{target_filepath.name}.part")
         try:
             response = session.get(url, stream=True, timeout=60)
             response.raise_for_status()
             total_size = int(response.headers.get("content-length", 0))
             target_filepath.parent.mkdir(parents=True, exist_ok=True)
-            with open(target_filepath, "wb") as file_object:
-                with Progress(console=console, transient=True) as progress:
-                    task = progress.add_task(
-                        f"[cyan]Downloading {target_filepath.name}", total=total_size
-                    )
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            file_object.write(chunk)
-                            progress.update(task, advance=len(chunk))
+            progress_context = (
+                Progress(console=console, transient=True)
+                if progress is None
+                else nullcontext(progress)
+            )
+            with (
+                open(partial_filepath, "wb") as file_object,
+                progress_context as active_progress,
+            ):
+                task = active_progress.add_task(
+                    f"[cyan]Downloading {target_filepath.name}", total=total_size
+                )
+                cancelled = False
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if cancel_event is not None and cancel_event.is_set():
+                        cancelled = True
+                        break
+                    if chunk:
+                        file_object.write(chunk)
+                        active_progress.update(task, advance=len(chunk))
+                active_progress.remove_task(task)
+            if cancelled:
+                logger.info(f"Download cancelled for {url}")
+                partial_filepath.unlink(missing_ok=True)
+                return False
+            os.replace(partial_filepath, target_filepath)
             return True
         except Exception as e:
             logger.error(f"Download failed for {url}: {e}")
-            if target_filepath.exists():
-                target_filepath.unlink()
+            partial_filepath.unlink(missing_ok=True)
             console.print(f"[red]❌ Download failed for {url}: {e}[/red]")
             return False
 
@@ -136,14 +204,17 @@ class DataIO:
         try:
             page_response = session.get(page_url, timeout=30)
             page_response.raise_for_status()
-            soup = BeautifulSoup(page_response.content, "html.parser")
+            # Only anchors pointing at matching files are kept while parsing
+            soup = BeautifulSoup(
+                page_response.content,
+                "html.parser",
+                parse_only=SoupStrainer(
+                    "a", href=lambda href: bool(href) and href.endswith(file_suffix)
+                ),
+            )
             for link_tag in soup.find_all("a", href=True):
                 href_path = link_tag["href"]
-                if (
-                    href_path.endswith(file_suffix)
-                    and not href_path.startswith(("?", "#"))
-                    and ".." not in href_path
-                ):
+                if not href_path.startswith(("?", "#")) and ".." not in href_path:
                     absolute_url = urljoin(page_url, href_path)
                     found_urls.append(absolute_url)
         except Exception as e:
@@ -156,7 +227,7 @@ class DataIO:
     ) -> bool:
         db_target_path.parent.mkdir(parents=True, exist_ok=True)
         db_connection_uri = f"sqlite:///{db_target_path.resolve()}"
-        csv_file_paths = list(csv_source_dir.rglob("*.csv.gz"))
+        csv_file_paths = list(iter_files_with_suffix(csv_source_dir, ".csv.gz"))
         if not csv_file_paths:
             return False
         successfully_loaded_count = 0
@@ -167,12 +238,11 @@ class DataIO:
             )
             for csv_file_path in csv_file_paths:
                 relative_path = csv_file_path.relative_to(csv_source_dir)
-                table_name_parts = [part.lower() for part in relative_path.parts]
                 table_name = (
-                    "_".join(table_name_parts)
+                    "_".join(relative_path.parts)
+                    .lower()
                     .replace(".csv.gz", "")
-                    .replace("-", "_")
-                    .replace(".", "_")
+                    .translate(TABLE_NAME_TRANSLATION)
                 )
                 try:
                     dataframe = self._load_csv_with_robust_parsing(
@@ -212,11 +282,15 @@ class DataIO:
                 ignore_errors=False,
                 null_values=["", "NULL", "null", "\\N", "NA"],
             )
-            if dataframe.height > 0:
+            # The empty-column report is debug-only; skip the column scans otherwise
+            if dataframe.height > 0 and logger.isEnabledFor(logging.DEBUG):
+                null_counts = dataframe.null_count().row(0)
                 empty_columns = [
                     column
-                    for column in dataframe.columns
-                    if dataframe[column].is_null().all()
+                    for column, null_count in zip(
+                        dataframe.columns, null_counts, strict=True
+                    )
+                    if null_count == dataframe.height
                 ]
                 if empty_columns:
                     logger.debug(f"Empty columns in {table_name}: {empty_columns}")
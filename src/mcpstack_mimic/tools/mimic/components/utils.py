@@ -1,9 +1,11 @@
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 from beartype import beartype
-from beartype.typing import Any, Dict
+from beartype.typing import Any, Dict, Iterator
 from MCPStack.core.config import StackConfig
 
 logger = logging.getLogger(__name__)
@@ -11,13 +13,20 @@ logger = logging.getLogger(__name__)
 CONFIG_DIR = Path(__file__).parent.parent / "configurations"
 
 
+@beartype
+def _load_yaml_config(filename: str) -> Dict[str, Any]:
+    yaml_path = CONFIG_DIR / filename
+    try:
+        with open(yaml_path) as f:
+            return yaml.safe_load(f)
+    except FileNotFoundError as e:
+        raise RuntimeError(f"{filename} not found at {yaml_path}") from e
+
+
+@lru_cache(maxsize=1)
 @beartype
 def load_supported_datasets() -> Dict[str, Dict[str, Any]]:
-    yaml_path = CONFIG_DIR / "datasets.yaml"
-    if not yaml_path.exists():
-        raise RuntimeError(f"datasets.yaml not found at {yaml_path}")
-    with open(yaml_path) as f:
-        return yaml.safe_load(f)
+    return _load_yaml_config("datasets.yaml")
 
 
 @beartype
@@ -47,24 +56,37 @@ def get_dataset_raw_files_path(config: StackConfig, dataset_name: str) -> Path:
     return path
 
 
+@lru_cache(maxsize=1)
 @beartype
 def load_security_config() -> Dict[str, Any]:
-    yaml_path = CONFIG_DIR / "security.yaml"
-    if not yaml_path.exists():
-        raise RuntimeError(f"security.yaml not found at {yaml_path}")
-    with open(yaml_path) as f:
-        return yaml.safe_load(f)
+    return _load_yaml_config("security.yaml")
 
 
+@lru_cache(maxsize=1)
 @beartype
 def load_env_vars_config() -> Dict[str, Any]:
-    yaml_path = CONFIG_DIR / "env_vars.yaml"
-    if not yaml_path.exists():
-        raise RuntimeError(f"env_vars.yaml not found at {yaml_path}")
-    with open(yaml_path) as f:
-        return yaml.safe_load(f)
+    return _load_yaml_config("env_vars.yaml")
 
 
 @beartype
 def validate_limit(value: int) -> bool:
     return isinstance(value, int) and 1 <= value <= 1000
+
+
+@beartype
+def iter_files_with_suffix(root: Path, suffix: str) -> Iterator[Path]:
+    # DirEntry caches the stat result, so each entry costs a single syscall;
+    # an explicit stack avoids a generator frame per directory level.
+    # Like Path.rglob, missing or unreadable directories are skipped.
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(suffix) and entry.is_file():
+                    yield Path(entry.path)
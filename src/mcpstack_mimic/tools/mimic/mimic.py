@@ -1,8 +1,10 @@
 import logging
+import re
+from functools import lru_cache
 
 import sqlparse
 from beartype import beartype
-from beartype.typing import Any, Callable, Dict, List, Optional, Tuple
+from beartype.typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 from MCPStack.core.config import StackConfig as M3Config
 from MCPStack.core.tool.base import BaseTool
 from MCPStack.core.utils.exceptions import MCPStackValidationError
@@ -21,6 +23,48 @@ from .components.utils import (
 logger = logging.getLogger(__name__)
 
 
+class SecurityChecks(NamedTuple):
+    dangerous_keywords_pattern: Optional[re.Pattern]
+    injection_patterns: List[Tuple[str, str]]
+    suspicious_names: Dict[str, str]
+    suspicious_names_pattern: Optional[re.Pattern]
+
+
+@lru_cache(maxsize=1)
+@beartype
+def load_security_checks() -> SecurityChecks:
+    security_config = load_security_config()
+    dangerous_keywords = sorted(set(security_config.get("dangerous_keywords", [])))
+    # Keywords only count when delimited by spaces or the query boundaries
+    dangerous_keywords_pattern = (
+        re.compile(
+            rf"(?<![^ ])(?:{'|'.join(map(re.escape, dangerous_keywords))})(?![^ ])"
+        )
+        if dangerous_keywords
+        else None
+    )
+    injection_patterns = [
+        (pattern.upper(), description)
+        for pattern, description in security_config.get("injection_patterns", [])
+    ]
+    suspicious_names = {
+        name.upper(): name for name in security_config.get("suspicious_names", [])
+    }
+    suspicious_names_pattern = (
+        re.compile(
+            "|".join(map(re.escape, sorted(suspicious_names, key=len, reverse=True)))
+        )
+        if suspicious_names
+        else None
+    )
+    return SecurityChecks(
+        dangerous_keywords_pattern,
+        injection_patterns,
+        suspicious_names,
+        suspicious_names_pattern,
+    )
+
+
 @beartype
 class MIMIC(BaseTool):
     TYPE = "mimic"
@@ -43,7 +87,6 @@ class MIMIC(BaseTool):
         self.backend_key = backend_key
         self._set_auth()
         self._validate_backend_key(backend_key)
-        self.security_config = {}
         self.table_names = {}
 
     def to_dict(self) -> Dict[str, Any]:
@@ -513,23 +556,28 @@ class MIMIC(BaseTool):
         sql_upper = sql_query.strip().upper()
         if sql_upper.startswith("PRAGMA"):
             return True, "Safe PRAGMA statement"
-        if not self.security_config:
-            self.security_config = load_security_config()
-        dangerous_keywords = set(self.security_config.get("dangerous_keywords", []))
-        for keyword in dangerous_keywords:
-            if f" {keyword} " in f" {sql_upper} ":
-                return False, f"Write operation not allowed: {keyword}"
-        injection_patterns = self.security_config.get("injection_patterns", [])
-        for pattern, description in injection_patterns:
-            if pattern.upper() in sql_upper:
+        checks = load_security_checks()
+        keyword_match = (
+            checks.dangerous_keywords_pattern.search(sql_upper)
+            if checks.dangerous_keywords_pattern
+            else None
+        )
+        if keyword_match:
+            return False, f"Write operation not allowed: {keyword_match.group()}"
+        for pattern_upper, description in checks.injection_patterns:
+            if pattern_upper in sql_upper:
                 return False, f"Injection pattern detected: {description}"
-        suspicious_names = set(self.security_config.get("suspicious_names", []))
-        for name in suspicious_names:
-            if name.upper() in sql_upper:
-                return (
-                    False,
-                    f"Suspicious identifier detected: {name} (not medical data)",
-                )
+        name_match = (
+            checks.suspicious_names_pattern.search(sql_upper)
+            if checks.suspicious_names_pattern
+            else None
+        )
+        if name_match:
+            name = checks.suspicious_names[name_match.group()]
+            return (
+                False,
+                f"Suspicious identifier detected: {name} (not medical data)",
+            )
         return True, "Safe"
 
     def _post_load(self) -> None:
@@ -3,6 +3,7 @@ import logging
 import os
 import sqlite3
 import tempfile
+import threading
 import zlib
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
@@ -10,7 +11,7 @@ from unittest.mock import MagicMock, Mock, patch
 import polars as pl
 import pytest
 import requests
-from beartype.typing import Dict, List
+from beartype.typing import Dict, Iterator, List
 from fastmcp import Client
 from MCPStack.cli import StackCLI
 from MCPStack.core.config import StackConfig as M3Config
@@ -26,6 +27,7 @@ from mcpstack_mimic.tools.mimic.components.data_io import COMMON_USER_AGENT, Dat
 from mcpstack_mimic.tools.mimic.components.utils import (
     get_dataset_config,
     get_dataset_raw_files_path,
+    iter_files_with_suffix,
 )
 from mcpstack_mimic.tools.mimic.mimic import MIMIC
 
@@ -408,6 +410,99 @@ class TestMimic:
             assert not target_path.exists()
             assert "Download failed" in caplog.text
 
+    def test_download_single_file_interrupted_keeps_target(
+        self, data_io: DataIO, mock_session: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test an interrupted download leaves neither a partial nor a clobbered file."""
+        target_path = tmp_path / "test.csv.gz"
+        target_path.write_text("previous")
+        dummy = DummyResponse("new content", headers={"content-length": "11"})
+
+        def broken_iter_content(chunk_size: int = 1) -> Iterator[bytes]:
+            yield b"new"
+            raise requests.exceptions.ChunkedEncodingError("connection reset")
+
+        dummy.iter_content = broken_iter_content
+        with patch.object(mock_session, "get", return_value=dummy):
+            success = data_io._download_single_file(
+                "http://example.com/test.csv.gz", target_path, mock_session
+            )
+        assert not success
+        assert target_path.read_text() == "previous"
+        assert list(tmp_path.iterdir()) == [target_path]
+
+    def test_download_dataset_files_downloads_all(
+        self, data_io: DataIO, tmp_path: Path
+    ) -> None:
+        """Test every scraped file is downloaded and failures are reported."""
+        dataset_config = {
+            "file_listing_url": "http://example.com/files/",
+            "subdirectories_to_scan": ["hosp", "icu"],
+        }
+        with (
+            patch.object(
+                data_io,
+                "_scrape_urls_from_html_page",
+                side_effect=lambda url, session: [f"{url}a.csv.gz", f"{url}b.csv.gz"],
+            ),
+            patch.object(
+                data_io, "_download_single_file", return_value=True
+            ) as mock_download,
+        ):
+            assert data_io._download_dataset_files(dataset_config, tmp_path)
+            targets = sorted(call.args[1] for call in mock_download.call_args_list)
+            worker_sessions = {call.args[2] for call in mock_download.call_args_list}
+            assert all(
+                session.headers["User-Agent"] == COMMON_USER_AGENT
+                for session in worker_sessions
+            )
+            assert targets == [
+                tmp_path / "hosp" / "a.csv.gz",
+                tmp_path / "hosp" / "b.csv.gz",
+                tmp_path / "icu" / "a.csv.gz",
+                tmp_path / "icu" / "b.csv.gz",
+            ]
+            mock_download.side_effect = lambda url, *args: "icu/b" not in url
+            assert not data_io._download_dataset_files(dataset_config, tmp_path)
+
+            # With a single worker the first failure must stop the queued files
+            mock_download.reset_mock()
+            mock_download.side_effect = lambda url, *args: False
+            with patch(
+                "mcpstack_mimic.tools.mimic.components.data_io.MAX_DOWNLOAD_WORKERS",
+                1,
+            ):
+                assert not data_io._download_dataset_files(dataset_config, tmp_path)
+            assert mock_download.call_count == 1
+            assert mock_download.call_args.args[1] == tmp_path / "hosp" / "a.csv.gz"
+
+    def test_download_single_file_stops_when_cancelled(
+        self, data_io: DataIO, mock_session: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test a cancelled in-flight download stops and removes its partial file."""
+        target_path = tmp_path / "test.csv.gz"
+        dummy = DummyResponse("abcdef", headers={"content-length": "6"})
+        cancel_event = threading.Event()
+        yielded_chunks = []
+
+        def cancelling_iter_content(chunk_size: int = 1) -> Iterator[bytes]:
+            for chunk in (b"ab", b"cd", b"ef"):
+                yielded_chunks.append(chunk)
+                cancel_event.set()
+                yield chunk
+
+        dummy.iter_content = cancelling_iter_content
+        with patch.object(mock_session, "get", return_value=dummy):
+            success = data_io._download_single_file(
+                "http://example.com/test.csv.gz",
+                target_path,
+                mock_session,
+                cancel_event=cancel_event,
+            )
+        assert not success
+        assert yielded_chunks == [b"ab"]
+        assert list(tmp_path.iterdir()) == []
+
     def test_load_csv_with_robust_parsing_success(
         self, data_io: DataIO, tmp_path: Path
     ) -> None:
@@ -548,6 +643,50 @@ class TestMimic:
             assert "mimic-iv-demo" in str(raw_path)
             assert raw_path.exists()
 
+    def test_iter_files_with_suffix_recurses(self, tmp_path: Path) -> None:
+        """Test suffix walker finds nested files and skips other suffixes."""
+        (tmp_path / "hosp").mkdir()
+        (tmp_path / "icu" / "nested").mkdir(parents=True)
+        (tmp_path / "hosp" / "patients.csv.gz").write_bytes(b"")
+        (tmp_path / "icu" / "nested" / "icustays.csv.gz").write_bytes(b"")
+        (tmp_path / "icu" / "README.txt").write_text("skip")
+        found = sorted(
+            p.relative_to(tmp_path).as_posix()
+            for p in iter_files_with_suffix(tmp_path, ".csv.gz")
+        )
+        assert found == ["hosp/patients.csv.gz", "icu/nested/icustays.csv.gz"]
+
+    def test_iter_files_with_suffix_missing_root(self, tmp_path: Path) -> None:
+        """Test a missing root yields nothing instead of raising, like rglob."""
+        assert list(iter_files_with_suffix(tmp_path / "nope", ".csv.gz")) == []
+
+    def test_iter_files_with_suffix_skips_unreadable_dir(self, tmp_path: Path) -> None:
+        """Test an unreadable subdirectory is skipped while siblings are still found."""
+        (tmp_path / "hosp").mkdir()
+        (tmp_path / "locked").mkdir()
+        (tmp_path / "hosp" / "patients.csv.gz").write_bytes(b"")
+        (tmp_path / "locked" / "secret.csv.gz").write_bytes(b"")
+        real_scandir = os.scandir
+
+        def scandir(path: str) -> Iterator[os.DirEntry]:
+            if Path(path).name == "locked":
+                raise PermissionError(f"Permission denied: {path}")
+            return real_scandir(path)
+
+        with patch(
+            "mcpstack_mimic.tools.mimic.components.utils.os.scandir",
+            side_effect=scandir,
+        ):
+            found = list(iter_files_with_suffix(tmp_path, ".csv.gz"))
+        assert found == [tmp_path / "hosp" / "patients.csv.gz"]
+
+    def test_etl_csv_collection_to_sqlite_missing_dir(
+        self, data_io: DataIO, tmp_path: Path
+    ) -> None:
+        """Test ETL from a missing raw directory returns False instead of raising."""
+        db_path = tmp_path / "M3_test_environment_test.db"
+        assert not data_io._etl_csv_collection_to_sqlite(tmp_path / "nope", db_path)
+
     @patch("mcpstack_mimic.tools.mimic.components.data_io.DataIO.initialize")
     @patch("sqlite3.connect")
     def test_mimic_init_respects_custom_db_path(
@@ -818,6 +957,48 @@ class TestMimic:
         if Path(test_db).exists():
             Path(test_db).unlink()
 
+    def test_is_safe_query_checks(self, tmp_path: Path) -> None:
+        """Test keyword, injection and identifier checks on SELECT queries."""
+        mimic = MIMIC(
+            backends=[SQLiteBackend(path=str(tmp_path / "safe.db"))],
+            config=M3Config(env_vars={}),
+            backend_key="sqlite",
+        )
+        assert mimic._is_safe_query("SELECT subject_id FROM icu_icustays LIMIT 5")[0]
+        assert mimic._is_safe_query("SELECT REPLACE(race, 'A', 'B') FROM hosp")[0]
+        assert mimic._is_safe_query("SELECT * FROM t REPLACE x") == (
+            False,
+            "Write operation not allowed: REPLACE",
+        )
+        assert mimic._is_safe_query("SELECT * FROM t WHERE a = 1 OR 1=1") == (
+            False,
+            "Injection pattern detected: Classic injection pattern",
+        )
+        is_safe, message = mimic._is_safe_query("SELECT password FROM accounts")
+        assert not is_safe
+        assert message == "Suspicious identifier detected: PASSWORD (not medical data)"
+
+    def test_sqlite_backend_truncates_large_results(self, tmp_path: Path) -> None:
+        """Test SQLite results show the first 50 rows and the full row count."""
+        db_path = tmp_path / "rows.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE numbers (n INTEGER)")
+        conn.execute("CREATE TABLE empty_table (n INTEGER)")
+        conn.executemany(
+            "INSERT INTO numbers VALUES (?)", [(i,) for i in range(25_000)]
+        )
+        conn.commit()
+        conn.close()
+
+        backend = SQLiteBackend(path=str(db_path))
+        backend.initialize()
+        result = backend.execute("SELECT n FROM numbers ORDER BY n")
+        assert "... (25000 total rows, showing first 50)" in result
+        assert "\n49\n" in result and "\n50\n" not in result
+        assert backend.execute("SELECT n FROM empty_table") == "No results found"
+        assert "... (" not in backend.execute("SELECT n FROM numbers LIMIT 3")
+        backend.teardown()
+
     @pytest.mark.asyncio
     async def test_invalid_sql(self, test_db: str) -> None:
         """Test handling of invalid SQL."""